@@ -1,7 +1,10 @@
 import logging
+import threading
+from functools import wraps
 from itertools import chain
-from typing import TYPE_CHECKING, List, Optional
+from typing import TYPE_CHECKING, Iterable, List, Optional, Tuple
 
+from dvc_objects.executors import ThreadPoolExecutor
 from dvc_objects.fs.callbacks import Callback
 from dvc_objects.fs.generic import test_links, transfer
 
@@ -173,6 +176,17 @@ class Link:
             raise LinkError(to_path) from exc
 
 
+def _synchronized(func):
+    lock = threading.Lock()
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        with lock:
+            return func(*args, **kwargs)
+
+    return wrapper
+
+
 def _checkout(
     diff,
     path,
@@ -183,6 +197,7 @@ def _checkout(
     relink=False,
     state=None,
     prompt=None,
+    jobs=None,
 ):
     if not diff:
         return
@@ -201,7 +216,8 @@ def _checkout(
             entry_path, fs, change.old.in_cache, force=force, prompt=prompt
         )
 
-    failed = []
+    entry_paths = []
+    changes = []
     for change in chain(diff.added, diff.modified):
         entry_path = (
             fs.path.join(path, *change.new.key)
@@ -211,10 +227,20 @@ def _checkout(
         if change.new.oid.isdir:
             fs.makedirs(entry_path)
             continue
+        entry_paths.append(entry_path)
+        changes.append(change)
+
+    parallel = bool(jobs and jobs > 1)
+    if prompt and parallel:
+        prompt = _synchronized(prompt)
 
+    def checkout_entry(entry_path, change) -> Tuple[str, List[str]]:
+        # NOTE: transfer drops unsupported link types from the list it is
+        # given, so threads must not share it.
+        entry_link = Link(list(links)) if parallel else link
         try:
             _checkout_file(
-                link,
+                entry_link,
                 entry_path,
                 fs,
                 change,
@@ -224,10 +250,30 @@ def _checkout(
                 state=state,
                 prompt=prompt,
             )
-            if progress_callback:
-                progress_callback(entry_path)
         except CheckoutError as exc:
-            failed.extend(exc.paths)
+            return entry_path, exc.paths
+        return entry_path, []
+
+    failed: List[str] = []
+
+    def consume(results: Iterable[Tuple[str, List[str]]]) -> None:
+        # progress is reported from here, so that the callback always runs
+        # on the calling thread, even when the entries are checked out by
+        # the workers.
+        for entry_path, entry_failed in results:
+            if entry_failed:
+                failed.extend(entry_failed)
+            elif progress_callback:
+                progress_callback(entry_path)
+
+    if parallel:
+        executor = ThreadPoolExecutor(max_workers=jobs, cancel_on_error=True)
+        with executor:
+            consume(
+                executor.imap_unordered(checkout_entry, entry_paths, changes)
+            )
+    else:
+        consume(map(checkout_entry, entry_paths, changes))
 
     if failed:
         raise CheckoutError(failed)
@@ -245,6 +291,7 @@ def checkout(
     ignore: Optional["Ignore"] = None,
     state=None,
     prompt=None,
+    jobs: Optional[int] = None,
 ):
     # if protocol(path) not in ["local", cache.fs.protocol]:
     #    raise NotImplementedError
@@ -278,6 +325,7 @@ def checkout(
             relink=relink,
             state=state,
             prompt=prompt,
+            jobs=jobs,
         )
     except CheckoutError as exc:
         failed.extend(exc.paths)
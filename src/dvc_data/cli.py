@@ -2,20 +2,20 @@ import enum
 import errno
 import hashlib
 import json
+import mmap
 import os
 import posixpath
 import sys
-from collections import deque
-from dataclasses import asdict
-from itertools import accumulate
+from collections import defaultdict
 from pathlib import Path
 from posixpath import relpath
-from typing import List, Optional
+from typing import Dict, List, Optional, Set, Tuple
 
 import click
 import typer  # pylint: disable=import-error
 from dvc_objects._tqdm import Tqdm
 from dvc_objects.errors import ObjectFormatError
+from dvc_objects.executors import ThreadPoolExecutor
 from dvc_objects.fs import LocalFileSystem, MemoryFileSystem
 from dvc_objects.fs.callbacks import Callback
 from dvc_objects.fs.utils import human_readable_to_bytes
@@ -28,7 +28,7 @@ from dvc_data.diff import ROOT
 from dvc_data.diff import diff as _diff
 from dvc_data.hashfile.db import HashFileDB
 from dvc_data.hashfile.hash import file_md5 as _file_md5
-from dvc_data.hashfile.hash import fobj_md5 as _fobj_md5
+from dvc_data.hashfile.hash import fobj_md5_readinto as _fobj_md5_readinto
 from dvc_data.hashfile.hash_info import HashInfo
 from dvc_data.hashfile.obj import HashFile
 from dvc_data.hashfile.state import State
@@ -69,6 +69,7 @@ LinkEnum = enum.Enum(  # type: ignore[misc]
     "LinkEnum", {lt: lt for lt in ["reflink", "hardlink", "symlink", "copy"]}
 )
 SIZE_HELP = "Human readable size, eg: '1kb', '100Mb', '10GB' etc"
+GENRAND_CHUNK_SIZE = 4 * 1024 * 1024
 
 
 class Application(typer.Typer):
@@ -105,8 +106,9 @@ def hash_file(
 
     with callback:
         if path == "-":
-            fobj = callback.wrap_attr(sys.stdin.buffer)
-            hash_value = _fobj_md5(fobj, text=text, name=hash_name)
+            hash_value = _fobj_md5_readinto(
+                sys.stdin.buffer, text=text, name=hash_name, callback=callback
+            )
         else:
             hash_value = _file_md5(
                 path, name=hash_name, callback=callback, text=text
@@ -129,14 +131,36 @@ def genrand(
     file: Path = typer.Argument(..., allow_dash=True),
     size: str = typer.Argument(..., help=SIZE_HELP),
 ):
+    remaining = human_readable_to_bytes(size)
     with file.open("wb") as f:
-        f.write(os.urandom(human_readable_to_bytes(size)))
+        while remaining > 0:
+            chunk_size = min(GENRAND_CHUNK_SIZE, remaining)
+            f.write(os.urandom(chunk_size))
+            remaining -= chunk_size
+
+
+def _resolve_prefix(oids: List[str], short_oid: str) -> str:
+    ret = [oid for oid in oids if oid.startswith(short_oid)]
+    if not ret:
+        raise KeyError(short_oid)
+    if len(ret) == 1:
+        return ret[0]
+    raise ValueError(short_oid, ret)
+
 
+def from_shortoid(
+    odb: HashFileDB, oid: str, oids: Optional[List[str]] = None
+) -> str:
+    """Resolve a short oid.
 
-def from_shortoid(odb: HashFileDB, oid: str) -> str:
+    Pass the same listing of the ODB as `oids` when resolving several oids
+    within one command, so that the ODB is only listed once.
+    """
     oid = oid if oid != "-" else sys.stdin.read().strip()
     try:
-        return odb.exists_prefix(oid)
+        if oids is None:
+            return odb.exists_prefix(oid)
+        return _resolve_prefix(oids, oid)
     except KeyError as exc:
         typer.echo(f"Not a valid {oid=}", err=True)
         raise typer.Exit(1) from exc
@@ -176,8 +200,19 @@ def p2o(path: Path = typer.Argument(..., allow_dash=True)):
 
 def _cat_object(odb, oid):
     path = odb.oid_to_path(oid)
-    contents = odb.fs.cat_file(path)
-    return typer.echo(contents)
+    if not isinstance(odb.fs, LocalFileSystem) or not odb.fs.size(path):
+        contents = odb.fs.cat_file(path)
+        return typer.echo(contents)
+
+    # write straight from the mapped pages instead of reading the whole
+    # object into memory first
+    stdout = click.get_binary_stream("stdout")
+    with open(path, "rb") as fobj, mmap.mmap(
+        fobj.fileno(), 0, access=mmap.ACCESS_READ
+    ) as contents:
+        stdout.write(contents)
+    stdout.write(b"\n")
+    return stdout.flush()
 
 
 @app.command(help="Provide content of the objects")
@@ -223,8 +258,12 @@ def build(
 
 
 def _ls_tree(tree):
-    for key, (_, hash_info) in tree.iteritems():
-        typer.echo(f"{hash_info.value}\t{posixpath.join(*key)}")
+    lines = [
+        f"{hash_info.value}\t{'/'.join(key)}"
+        for key, (_, hash_info) in tree.iteritems()
+    ]
+    if lines:
+        typer.echo("\n".join(lines))
 
 
 @app.command("ls", help="List objects in a tree")
@@ -276,36 +315,72 @@ def rm(oid: str = typer.Argument(..., allow_dash=True)):
     odb.fs.remove(path)
 
 
+def _fast_du(object_dir: str) -> Tuple[int, int]:
+    """Count objects in a local ODB and sum their sizes, by scanning the
+    two-level sharded directory directly instead of stat-ing every oid."""
+    count = total = 0
+    if not os.path.isdir(object_dir):
+        return count, total
+
+    with os.scandir(object_dir) as shards:
+        for shard in shards:
+            if len(shard.name) != 2 or not shard.is_dir():
+                continue
+            with os.scandir(shard.path) as entries:
+                for entry in entries:
+                    if entry.is_file():
+                        count += 1
+                        total += entry.stat().st_size
+    return count, total
+
+
+def _count_objects(odb: HashFileDB) -> Tuple[int, int]:
+    if isinstance(odb.fs, LocalFileSystem):
+        return _fast_du(odb.path)
+    sizes = [odb.fs.size(odb.oid_to_path(oid)) for oid in odb.all()]
+    return len(sizes), sum(sizes)
+
+
 @app.command(
     help="Count objects and their disk consumption", no_args_is_help=False
 )
 def count_objects():
     odb = get_odb()
-    it = (odb.fs.size(odb.oid_to_path(oid)) for oid in odb.all())
-    item = deque(enumerate(accumulate(it), 1), maxlen=1)
-    count, total = item[0] if item else (0, 0)
+    count, total = _count_objects(odb)
     hsize = Tqdm.format_sizeof(total, suffix="B", divisor=1024)
     typer.echo(f"{count} objects, {hsize} size")
 
 
 @app.command(help="Verify objects in the database", no_args_is_help=False)
-def fsck():
+def fsck(
+    jobs: Optional[int] = typer.Option(
+        None, "--jobs", "-j", help="Number of objects to verify in parallel"
+    ),
+):
     odb = get_odb()
-    ret = 0
-    for oid in odb.all():
+
+    def _check(oid):
         try:
             odb.check(oid, check_hash=True)
         except ObjectFormatError as exc:
-            ret = 1
-            typer.echo(exc)
+            return exc
+        return None
+
+    ret = 0
+    with ThreadPoolExecutor(max_workers=jobs or odb.fs.hash_jobs) as executor:
+        for exc in executor.imap_unordered(_check, odb.all()):
+            if exc:
+                ret = 1
+                typer.echo(exc)
     raise typer.Exit(ret)
 
 
 @app.command(help="Diff two objects in the database")
 def diff(short_oid1, short_oid2: str, unchanged: bool = False):
     odb = get_odb()
-    obj1 = odb.get(from_shortoid(odb, short_oid1))
-    obj2 = odb.get(from_shortoid(odb, short_oid2))
+    oids = list(odb.all())
+    obj1 = odb.get(from_shortoid(odb, short_oid1, oids))
+    obj2 = odb.get(from_shortoid(odb, short_oid2, oids))
     d = _diff(load(odb, obj1.hash_info), load(odb, obj2.hash_info), odb)
 
     def _prepare_info(entry):
@@ -316,8 +391,8 @@ def diff(short_oid1, short_oid2: str, unchanged: bool = False):
         cache_info = "" if entry.in_cache else ", missing"
         return f"{path} ({oid}{cache_info})"
 
-    for state, changes in asdict(d).items():
-        for change in changes:
+    for state in ("added", "modified", "deleted", "unchanged"):
+        for change in getattr(d, state):
             if not unchanged and state == "unchanged" and change.new.in_cache:
                 continue
             if state == "modified":
@@ -336,8 +411,9 @@ def diff(short_oid1, short_oid2: str, unchanged: bool = False):
 @app.command(help="Merge two trees and optionally write to the database.")
 def merge_tree(oid1: str, oid2: str, force: bool = False):
     odb = get_odb()
-    oid1 = from_shortoid(odb, oid1)
-    oid2 = from_shortoid(odb, oid2)
+    oids = list(odb.all())
+    oid1 = from_shortoid(odb, oid1, oids)
+    oid2 = from_shortoid(odb, oid2, oids)
     obj1 = load(odb, odb.get(oid1).hash_info)
     obj2 = load(odb, odb.get(oid2).hash_info)
     assert isinstance(obj1, Tree) and isinstance(obj2, Tree), "not a tree obj"
@@ -366,15 +442,15 @@ def process_patch(patch_file, **kwargs):
     patch = []
     if patch_file:
         with typer.open_file(patch_file) as f:
-            text = f.read()
-            patch = json.loads(text)
-            for appl in patch:
-                op = appl.get("op")
-                path = appl.get("path")
-                if op and path and op in ("add", "modify"):
-                    patch[appl]["path"] = os.fspath(
-                        patch_file.parent.joinpath(path)
-                    )
+            patch = json.load(f)
+
+        # local paths in the patch file are relative to the patch file
+        base = os.path.dirname(patch_file)
+        for appl in patch:
+            op = appl.get("op")
+            path = appl.get("path")
+            if op and path and op in ("add", "modify"):
+                appl["path"] = os.path.join(base, path)
 
     for op, items in kwargs.items():
         for item in items:
@@ -388,39 +464,93 @@ def process_patch(patch_file, **kwargs):
     return patch
 
 
-def apply_op(odb, obj, application):
-    assert "op" in application
-    op = application["op"]
-    path = application["path"]
-    keys = tuple(path.split("/"))
-    # pylint: disable=protected-access
-    if op in ("add", "modify"):
-        new = tuple(application["to"].split("/"))
-        if op == "add" and new in obj._dict:
-            raise FileExistsError(
-                errno.EEXIST, os.strerror(errno.EEXIST), path
-            )
+def _key(path: str, cache: Dict[str, Tuple[str, ...]]) -> Tuple[str, ...]:
+    """Split a tree path into a key, sharing one tuple per distinct path."""
+    key = cache.get(path)
+    if key is None:
+        key = cache[path] = tuple(path.split("/"))
+    return key
 
-        fs = LocalFileSystem()
-        _, meta, new_obj = _build(odb, path, fs, "md5")
-        odb.add(path, fs, new_obj.hash_info.value, hardlink=False)
-        return obj.add(new, meta, new_obj.hash_info)
 
+# pylint: disable=protected-access,unused-argument
+def _ensure_exists(obj, path, keys):
     if keys not in obj._dict:
         raise FileNotFoundError(errno.ENOENT, os.strerror(errno.ENOENT), path)
-    if op == "test":
-        return
-    if op == "remove":
-        obj._dict.pop(keys)
-        obj.__dict__.pop("trie", None)
-        return
-    if op in ("copy", "move"):
-        new = tuple(application["to"].split("/"))
-        obj.add(new, *obj.get(keys))
-        if op == "move":
-            obj._dict.pop(keys)
-        return
-    raise ValueError(f"unknown {op=}")
+
+
+def _op_modify(odb, obj, path, keys, new):
+    fs = LocalFileSystem()
+    object_store, meta, new_obj = _build(odb, path, fs, "md5")
+    obj.add(new, meta, new_obj.hash_info)
+    return object_store, new_obj.hash_info
+
+
+def _op_add(odb, obj, path, keys, new):
+    if new in obj._dict:
+        raise FileExistsError(errno.EEXIST, os.strerror(errno.EEXIST), path)
+    return _op_modify(odb, obj, path, keys, new)
+
+
+def _op_test(odb, obj, path, keys, new):
+    _ensure_exists(obj, path, keys)
+
+
+def _op_remove(odb, obj, path, keys, new):
+    _ensure_exists(obj, path, keys)
+    obj._dict.pop(keys)
+    obj.__dict__.pop("trie", None)
+
+
+def _op_copy(odb, obj, path, keys, new):
+    _ensure_exists(obj, path, keys)
+    obj.add(new, *obj.get(keys))
+
+
+def _op_move(odb, obj, path, keys, new):
+    _op_copy(odb, obj, path, keys, new)
+    obj._dict.pop(keys)
+
+
+# pylint: enable=protected-access,unused-argument
+_OPS = {
+    "add": _op_add,
+    "modify": _op_modify,
+    "remove": _op_remove,
+    "test": _op_test,
+    "copy": _op_copy,
+    "move": _op_move,
+}
+_OPS_WITH_TARGET = frozenset({"add", "modify", "copy", "move"})
+# for these ops, "path" is a local file and only "to" is a path in the tree
+_OPS_WITH_LOCAL_PATH = frozenset({"add", "modify"})
+
+
+def apply_op(odb, obj, application, key_cache=None):
+    """Apply a single patch operation to the tree `obj` in place.
+
+    For "add" and "modify", the new file is only staged: an
+    `(object_store, hash_info)` pair is returned, which still needs to be
+    transferred to `odb`.
+
+    `key_cache` can be shared between the ops of a patch, so that they
+    reuse the same key tuples for the same tree paths.
+    """
+    assert "op" in application
+    op = application["op"]
+    try:
+        handler = _OPS[op]
+    except KeyError as exc:
+        raise ValueError(f"unknown {op=}") from exc
+    if op in _OPS_WITH_TARGET and "to" not in application:
+        raise ValueError(f"missing 'to' for {op=}")
+
+    if key_cache is None:
+        key_cache = {}
+    path = application["path"]
+    keys = None if op in _OPS_WITH_LOCAL_PATH else _key(path, key_cache)
+    to = application.get("to")
+    new = _key(to, key_cache) if to is not None else None
+    return handler(odb, obj, path, keys, new)
 
 
 def multi_value(*opts, **kwargs):
@@ -484,12 +614,20 @@ def update_tree(oid, patch_file, add, modify, move, copy, remove, test):
         move=move,
         test=test,
     )
+    staged: Dict[HashFileDB, Set[HashInfo]] = defaultdict(set)
+    key_cache: Dict[str, Tuple[str, ...]] = {}
     for application in patch:
         try:
-            apply_op(odb, obj, application)
-        except (FileExistsError, FileNotFoundError) as exc:
+            ret = apply_op(odb, obj, application, key_cache)
+        except (FileExistsError, FileNotFoundError, ValueError) as exc:
             typer.echo(exc, err=True, color=True)
             raise typer.Exit(1) from exc
+        if ret:
+            object_store, hash_info = ret
+            staged[object_store].add(hash_info)
+
+    for object_store, obj_ids in staged.items():
+        _transfer(object_store, odb, obj_ids, hardlink=False)
 
     obj.digest()
     typer.echo(obj)
@@ -505,8 +643,14 @@ def checkout(
     type: List[LinkEnum] = typer.Option(  # pylint: disable=redefined-builtin
         ["copy"]
     ),
+    jobs: Optional[int] = typer.Option(
+        None, "--jobs", "-j", help="Number of files to copy in parallel"
+    ),
 ):
-    odb = get_odb(type=[t.value for t in type])
+    link_types = [t.value for t in type]
+    odb = get_odb(type=link_types)
+    if jobs is None and "copy" in link_types:
+        jobs = odb.fs.jobs
     oid = from_shortoid(odb, oid)
     obj = load(odb, odb.get(oid).hash_info)
     with Tqdm(total=len(obj), desc="Checking out", unit="obj") as pbar:
@@ -520,6 +664,7 @@ def checkout(
             prompt=typer.confirm,
             state=odb.state,
             progress_callback=lambda *_: pbar.update(),
+            jobs=jobs,
         )
 
 
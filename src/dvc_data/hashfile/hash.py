@@ -1,7 +1,17 @@
 import hashlib
 import io
 import logging
-from typing import TYPE_CHECKING, Any, BinaryIO, Dict, Optional, Tuple
+import os
+from contextlib import suppress
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    BinaryIO,
+    Dict,
+    Optional,
+    Tuple,
+    Union,
+)
 
 from dvc_objects.fs.callbacks import DEFAULT_CALLBACK, Callback, TqdmCallback
 from dvc_objects.fs.implementations.local import localfs
@@ -30,6 +40,25 @@ def get_hasher(name: str) -> "hashlib._Hash":
         return hashlib.new(name)
 
 
+def _hash_chunk(
+    hasher: "hashlib._Hash",
+    chunk: Union[bytes, bytearray],
+    is_text: Optional[bool],
+) -> Tuple[bool, int]:
+    """Feed a chunk to the hasher, normalizing line endings of text data.
+
+    If `is_text` is None, it is detected from the start of the chunk.
+    Returns `is_text` and the number of bytes that were hashed.
+    """
+    if is_text is None:
+        # do we need to buffer till the DEFAULT_CHUNK_SIZE?
+        is_text = istextblock(chunk[:DEFAULT_CHUNK_SIZE])
+
+    data = dos2unix(chunk) if is_text else chunk
+    hasher.update(data)
+    return is_text, len(data)
+
+
 class HashStreamFile(io.IOBase):
     def __init__(
         self,
@@ -51,13 +80,9 @@ class HashStreamFile(io.IOBase):
 
     def read(self, n=-1) -> bytes:
         chunk = self.fobj.read(n)
-        if self.is_text is None and chunk:
-            # do we need to buffer till the DEFAULT_CHUNK_SIZE?
-            self.is_text = istextblock(chunk[:DEFAULT_CHUNK_SIZE])
-
-        data = dos2unix(chunk) if self.is_text else chunk
-        self.hasher.update(data)
-        self.total_read += len(data)
+        if chunk:
+            self.is_text, size = _hash_chunk(self.hasher, chunk, self.is_text)
+            self.total_read += size
         return chunk
 
     @property
@@ -87,6 +112,45 @@ def fobj_md5(
     return stream.hash_value
 
 
+def fobj_md5_readinto(
+    fobj: BinaryIO,
+    chunk_size: int = 2**20,
+    text: Optional[bool] = None,
+    name: str = "md5",
+    callback: "Callback" = DEFAULT_CALLBACK,
+) -> str:
+    """Same as `fobj_md5`, but reads into a single reusable buffer instead
+    of allocating a new chunk on every read.
+
+    The buffer is only hashed in place for binary data, text data still
+    needs a normalized copy of every chunk.
+    """
+    assert chunk_size >= DEFAULT_CHUNK_SIZE
+    hasher = get_hasher(name)
+    is_text = text
+    buf = bytearray(chunk_size)
+    while True:
+        nread = fobj.readinto(buf)  # type: ignore[attr-defined]
+        if not nread:
+            break
+        # only a short read (usually the last one) needs to be sliced
+        chunk = buf if nread == chunk_size else buf[:nread]
+        is_text, _ = _hash_chunk(hasher, chunk, is_text)
+        callback.relative_update(nread)
+    return hasher.hexdigest()
+
+
+def _advise_sequential(fobj: BinaryIO) -> None:
+    # Let the kernel grow its readahead window, so that the disk keeps
+    # reading the next chunks while we are busy hashing the current one.
+    if not hasattr(os, "posix_fadvise") or not hasattr(
+        os, "POSIX_FADV_SEQUENTIAL"
+    ):
+        return
+    with suppress(OSError, ValueError):
+        os.posix_fadvise(fobj.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+
+
 def file_md5(
     fname: "AnyFSPath",
     fs: "FileSystem" = localfs,
@@ -97,6 +161,8 @@ def file_md5(
     size = fs.size(fname) or 0
     callback.set_size(size)
     with fs.open(fname, "rb") as fobj:
+        if fs.protocol == "local":
+            _advise_sequential(fobj)
         return fobj_md5(callback.wrap_attr(fobj), text=text, name=name)
 
 
@@ -1,13 +1,14 @@
 import json
 import logging
 import posixpath
+from io import BytesIO
 from typing import TYPE_CHECKING, Dict, Final, Iterable, Optional, Tuple
 
 from dvc_objects.errors import ObjectFormatError
 from dvc_objects.obj import Object
 from funcy import cached_property
 
-from ..hashfile.hash import hash_file
+from ..hashfile.hash import fobj_md5
 from ..hashfile.obj import HashFile
 
 if TYPE_CHECKING:
@@ -76,12 +77,17 @@ class Tree(HashFile):
         from dvc_objects.fs import MemoryFileSystem
         from dvc_objects.fs.utils import tmp_fname
 
+        from ..hashfile.hash_info import HashInfo
+
         memfs = MemoryFileSystem()
         path = "memory://{}".format(tmp_fname(""))
-        memfs.pipe_file(path, self.as_bytes())
+        data = self.as_bytes()
+        memfs.pipe_file(path, data)
         self.fs = memfs
         self.path = path
-        _, self.hash_info = hash_file(path, memfs, "md5")
+        # hash the bytes we already have instead of reading them back from
+        # memfs, it is exactly what `hash_file` would compute for them.
+        self.hash_info = HashInfo("md5", fobj_md5(BytesIO(data)))
         assert self.hash_info.value
         self.hash_info.value += ".dir"
         self.oid = self.hash_info.value
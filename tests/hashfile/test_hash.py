@@ -1,5 +1,7 @@
+import os
 from os import fspath
 
+import pytest
 from dvc_objects.fs import LocalFileSystem
 
 from dvc_data.hashfile.hash import file_md5
@@ -20,3 +22,17 @@ def test_file_md5_crlf(tmp_path):
     cr.write_bytes(b"a\nb\nc")
     crlf.write_bytes(b"a\r\nb\r\nc")
     assert file_md5(fspath(cr), fs) == file_md5(fspath(crlf), fs)
+
+
+@pytest.mark.skipif(
+    not hasattr(os, "posix_fadvise"), reason="posix_fadvise is not available"
+)
+def test_file_md5_advises_sequential_reads(tmp_path, mocker):
+    foo = tmp_path / "foo"
+    foo.write_text("foo content", encoding="utf8")
+
+    fs = LocalFileSystem()
+    expected = file_md5(fspath(foo), fs)
+    spy = mocker.patch("os.posix_fadvise")
+    assert file_md5(fspath(foo), fs) == expected
+    spy.assert_called_once()
@@ -3,7 +3,12 @@ from os import fspath
 import pytest
 from dvc_objects.fs import LocalFileSystem
 
-from dvc_data.hashfile.hash import HashStreamFile, file_md5
+from dvc_data.hashfile.hash import (
+    HashStreamFile,
+    file_md5,
+    fobj_md5,
+    fobj_md5_readinto,
+)
 from dvc_data.hashfile.istextfile import DEFAULT_CHUNK_SIZE, istextfile
 
 
@@ -72,3 +77,18 @@ def test_hashed_stream_reader_compatibility(tmp_path, contents):
 
     assert stream_reader.is_text is istextfile(fspath(data), local_fs)
     assert stream_reader.hash_value == hex_digest
+
+
+@pytest.mark.parametrize(
+    "contents",
+    [b"", b"a\r\nb\r\nc", b"not clean \x00", b"x" * (3 * DEFAULT_CHUNK_SIZE)],
+)
+def test_fobj_md5_readinto(tmp_path, contents):
+    data = tmp_path / "data"
+    data.write_bytes(contents)
+
+    with open(data, "rb") as fobj:
+        expected = fobj_md5(fobj, chunk_size=DEFAULT_CHUNK_SIZE)
+    with open(data, "rb") as fobj:
+        actual = fobj_md5_readinto(fobj, chunk_size=DEFAULT_CHUNK_SIZE)
+    assert actual == expected
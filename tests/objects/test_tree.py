@@ -2,6 +2,7 @@ from operator import itemgetter
 
 import pytest
 
+from dvc_data.hashfile.hash import hash_file
 from dvc_data.hashfile.hash_info import HashInfo
 from dvc_data.hashfile.meta import Meta
 from dvc_data.objects.tree import Tree, _merge
@@ -198,3 +199,14 @@ def test_items(trie_dict):
 def test_merge(ancestor_dict, our_dict, their_dict, merged_dict):
     actual = _merge(ancestor_dict, our_dict, their_dict)
     assert actual == merged_dict
+
+
+def test_digest():
+    tree = Tree()
+    tree.add(("dir", "a"), None, HashInfo("md5", "123"))
+    tree.add(("b",), None, HashInfo("md5", "456"))
+    tree.digest()
+
+    _, hash_info = hash_file(tree.path, tree.fs, "md5")
+    assert tree.oid == tree.hash_info.value == f"{hash_info.value}.dir"
+    assert tree.fs.cat_file(tree.path) == tree.as_bytes()
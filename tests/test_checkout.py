@@ -0,0 +1,76 @@
+import os
+import threading
+
+import pytest
+from dvc_objects.fs import LocalFileSystem
+
+from dvc_data.build import build
+from dvc_data.checkout import CheckoutError, checkout
+from dvc_data.hashfile.db import HashFileDB
+from dvc_data.transfer import transfer
+
+
+@pytest.fixture
+def odb_with_tree(tmp_path):
+    fs = LocalFileSystem()
+    odb = HashFileDB(fs, os.fspath(tmp_path / "cache"))
+
+    data = tmp_path / "data"
+    (data / "sub").mkdir(parents=True)
+    for i in range(8):
+        (data / f"file{i}").write_text(f"file {i}", encoding="utf8")
+        (data / "sub" / f"file{i}").write_text(f"sub {i}", encoding="utf8")
+
+    staging, _, obj = build(odb, os.fspath(data), fs, "md5")
+    transfer(staging, odb, {obj.hash_info}, hardlink=True, shallow=False)
+    return odb, obj
+
+
+def test_checkout_jobs(tmp_path, odb_with_tree):
+    odb, obj = odb_with_tree
+    fs = LocalFileSystem()
+    out = tmp_path / "out"
+
+    checked_out = []
+    checkout(
+        os.fspath(out),
+        fs,
+        obj,
+        odb,
+        jobs=4,
+        progress_callback=lambda path, *_: checked_out.append(
+            (path, threading.get_ident())
+        ),
+    )
+
+    for i in range(8):
+        assert (out / f"file{i}").read_text(encoding="utf8") == f"file {i}"
+        assert (out / "sub" / f"file{i}").read_text(
+            encoding="utf8"
+        ) == f"sub {i}"
+    assert sorted(path for path, _ in checked_out) == sorted(
+        os.path.join(os.fspath(out), *key) for key, _, _ in obj
+    )
+    # callbacks are not run from the worker threads
+    assert {ident for _, ident in checked_out} == {threading.get_ident()}
+
+
+def test_checkout_jobs_collects_failures(tmp_path, odb_with_tree):
+    odb, obj = odb_with_tree
+    fs = LocalFileSystem()
+    out = tmp_path / "out"
+
+    missing = [("file1",), ("sub", "file2")]
+    for key in missing:
+        _, hash_info = obj.get(key)
+        fs.remove(odb.oid_to_path(hash_info.value))
+
+    with pytest.raises(CheckoutError) as exc_info:
+        checkout(os.fspath(out), fs, obj, odb, jobs=4)
+
+    assert sorted(exc_info.value.paths) == sorted(
+        os.path.join(os.fspath(out), *key) for key in missing
+    )
+    for key, _, _ in obj:
+        if key not in missing:
+            assert (out.joinpath(*key)).exists()
@@ -0,0 +1,119 @@
+import io
+import json
+import os
+
+import pytest
+import typer
+from dvc_objects.fs import LocalFileSystem, MemoryFileSystem
+
+from dvc_data.cli import (
+    _count_objects,
+    _resolve_prefix,
+    from_shortoid,
+    process_patch,
+)
+from dvc_data.hashfile.db import HashFileDB
+
+OIDS = [
+    "1234567890abcdef1234567890abcdef",
+    "12ab567890abcdef1234567890abcdef",
+    "12abc67890abcdef1234567890abcdef",
+    "9876543210abcdef1234567890abcdef",
+]
+
+
+@pytest.fixture
+def odb():
+    odb = HashFileDB(MemoryFileSystem(global_store=False), "memory://odb")
+    for oid in OIDS:
+        odb.add_bytes(oid, oid.encode())
+    return odb
+
+
+@pytest.mark.parametrize(
+    "short_oid, expected",
+    [
+        ("1234", OIDS[0]),
+        ("12abc", OIDS[2]),
+        ("9", OIDS[3]),
+        (OIDS[1], OIDS[1]),
+    ],
+)
+def test_resolve_prefix(short_oid, expected):
+    assert _resolve_prefix(OIDS, short_oid) == expected
+
+
+def test_resolve_prefix_ambiguous():
+    with pytest.raises(ValueError):
+        _resolve_prefix(OIDS, "12ab")
+
+
+def test_resolve_prefix_missing():
+    with pytest.raises(KeyError):
+        _resolve_prefix(OIDS, "00")
+
+
+@pytest.mark.parametrize("use_listing", [False, True])
+def test_from_shortoid(odb, capsys, use_listing):
+    oids = list(odb.all()) if use_listing else None
+
+    assert from_shortoid(odb, "1234", oids) == OIDS[0]
+    assert from_shortoid(odb, "9", oids) == OIDS[3]
+
+    with pytest.raises(typer.Exit):
+        from_shortoid(odb, "12ab", oids)
+    assert "Ambiguous oid='12ab'" in capsys.readouterr().err
+
+    with pytest.raises(typer.Exit):
+        from_shortoid(odb, "00", oids)
+    assert "Not a valid oid='00'" in capsys.readouterr().err
+
+
+def test_count_objects_local(tmp_path):
+    odb = HashFileDB(LocalFileSystem(), os.fspath(tmp_path / "odb"))
+    assert _count_objects(odb) == (0, 0)
+
+    for i, oid in enumerate(OIDS):
+        odb.add_bytes(oid, b"x" * i)
+    # not part of the sharded layout, should not be counted
+    (tmp_path / "odb" / "stray").write_bytes(b"stray")
+
+    sizes = [odb.fs.size(odb.oid_to_path(oid)) for oid in odb.all()]
+    assert _count_objects(odb) == (len(sizes), sum(sizes)) == (4, 6)
+
+
+PATCH = [
+    {"op": "add", "path": "local.txt", "to": "foo"},
+    {"op": "modify", "path": "dir/local.txt", "to": "bar"},
+    {"op": "remove", "path": "data/file"},
+]
+
+
+def test_process_patch_file(tmp_path):
+    patch_dir = tmp_path / "patches"
+    patch_dir.mkdir()
+    patch_file = patch_dir / "patch.json"
+    patch_file.write_text(json.dumps(PATCH), encoding="utf8")
+
+    patch = process_patch(os.fspath(patch_file), move=[("a", "b")])
+    assert patch == [
+        {
+            "op": "add",
+            "path": os.path.join(os.fspath(patch_dir), "local.txt"),
+            "to": "foo",
+        },
+        {
+            "op": "modify",
+            "path": os.path.join(os.fspath(patch_dir), "dir/local.txt"),
+            "to": "bar",
+        },
+        # tree paths are left as is
+        {"op": "remove", "path": "data/file"},
+        {"op": "move", "path": "a", "to": "b"},
+    ]
+
+
+def test_process_patch_stdin(monkeypatch):
+    monkeypatch.setattr("sys.stdin", io.StringIO(json.dumps(PATCH)))
+    # relative to the working directory
+    assert process_patch("-") == PATCH